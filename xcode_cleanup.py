@@ -4,12 +4,22 @@ Xcode Cleanup Tool - Interactive CLI
 Removes Xcode cache files and frees up disk space.
 """
 
+import asyncio
+import atexit
+import ctypes
+import ctypes.util
+import json
 import os
+import shlex
+import stat
+import struct
 import subprocess
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import Callable, List, Dict, Optional, Tuple
 import sys
+import time
 
 try:
     from rich.console import Console
@@ -42,6 +52,8 @@ except ImportError:
 
 console = Console()
 
+HOME = os.path.expanduser('~')
+
 # Cleanup categories configuration
 CATEGORIES = [
     {
@@ -127,6 +139,13 @@ CATEGORIES = [
     }
 ]
 
+# Resolve directory paths and command lines once instead of on every call
+for _category in CATEGORIES:
+    if _category['type'] == 'directory':
+        _category['expanded_path'] = os.path.expanduser(_category['path'])
+    elif _category['type'] == 'command':
+        _category['argv'] = shlex.split(_category['path'])
+
 # Custom style for questionary - neutral green theme
 custom_style = Style([
     ('qmark', 'fg:#00aa00 bold'),
@@ -141,44 +160,331 @@ custom_style = Style([
 ])
 
 
-def get_directory_size(path: str) -> Tuple[str, int]:
-    """Get the size of a directory."""
-    expanded_path = os.path.expanduser(path)
+# Directories with fewer top-level subdirectories than this are sized serially;
+# below that the thread pool overhead outweighs the parallel stat walk.
+PARALLEL_MIN_SUBDIRS = 4
+
+# Sizes measured by a full walk this run, keyed by real path. Only these are
+# reported as "Size Freed"; estimates from the disk cache never land here.
+_size_cache: Dict[str, Tuple[str, int]] = {}
+
+# Sizes from previous runs: real path -> [mtime fingerprint (ns), bytes, saved at].
+# The fingerprint misses writes below the top-level subdirectories, so these
+# are only shown as estimates ("~") in the details view.
+SIZE_CACHE_FILE = os.path.join(HOME, '.cache', 'xcode_cleanup', 'sizes.json')
+SIZE_CACHE_MAX_AGE = 7 * 24 * 60 * 60  # seconds
+_disk_cache: Dict[str, List] = {}
+
+# Xcode marks its bulkiest caches (Build/Intermediates.noindex, Index.noindex,
+# ModuleCache.noindex) with this suffix. They hold most of the files, so they
+# are sized by `du` in C instead of being walked entry by entry in Python.
+NOINDEX_SUFFIX = '.noindex'
+
+# Maximum number of paths handed to a single `rm -rf` process
+RM_BATCH_SIZE = 32
+
+# getattrlistbulk(2) constants from <sys/attr.h> and <sys/vnode.h>
+ATTR_BIT_MAP_COUNT = 5
+ATTR_CMN_NAME = 0x00000001
+ATTR_CMN_OBJTYPE = 0x00000008
+ATTR_CMN_ERROR = 0x20000000
+ATTR_CMN_RETURNED_ATTRS = 0x80000000
+ATTR_FILE_ALLOCSIZE = 0x00000004
+VDIR = 2
+
+# One buffer holds the attributes of many directory entries per syscall
+BULK_BUFFER_SIZE = 64 * 1024
+
+
+class _AttrList(ctypes.Structure):
+    """struct attrlist from <sys/attr.h>."""
+    _fields_ = [
+        ('bitmapcount', ctypes.c_uint16),
+        ('reserved', ctypes.c_uint16),
+        ('commonattr', ctypes.c_uint32),
+        ('volattr', ctypes.c_uint32),
+        ('dirattr', ctypes.c_uint32),
+        ('fileattr', ctypes.c_uint32),
+        ('forkattr', ctypes.c_uint32),
+    ]
+
+
+def _load_getattrlistbulk():
+    """Return libc's getattrlistbulk on macOS, or None if unavailable."""
+    if sys.platform != 'darwin':
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        func = libc.getattrlistbulk
+    except (OSError, AttributeError):
+        return None
+    func.argtypes = [
+        ctypes.c_int,
+        ctypes.POINTER(_AttrList),
+        ctypes.c_void_p,
+        ctypes.c_size_t,
+        ctypes.c_uint64,
+    ]
+    func.restype = ctypes.c_int
+    return func
+
+
+_getattrlistbulk = _load_getattrlistbulk()
+
+
+def _format_size(num_bytes: int) -> str:
+    """Format a byte count like `du -h` does (e.g. 512B, 1.5K, 12G)."""
+    size = float(num_bytes)
+    for unit in 'BKMGT':
+        if size < 1024 or unit == 'T':
+            break
+        size /= 1024
+    if unit == 'B':
+        return f"{int(size)}B"
+    return f"{size:.1f}{unit}" if size < 10 else f"{size:.0f}{unit}"
+
+
+def _allocated_size(st: os.stat_result) -> int:
+    """Bytes allocated on disk for a file, as counted by du (512-byte blocks)."""
+    return st.st_blocks * 512
+
+
+def _du_size(path) -> int:
+    """Allocated size of a directory tree in bytes, as reported by `du -sk`."""
+    try:
+        output = subprocess.check_output(['du', '-sk', path], stderr=subprocess.DEVNULL)
+    except subprocess.CalledProcessError as e:
+        # du exits non-zero on unreadable entries but still prints a total
+        output = e.output
+    try:
+        # int() parses the ASCII digits straight from bytes; no decoding needed
+        return int(output.split(b'\t', 1)[0]) * 1024
+    except ValueError:
+        raise OSError(f"du failed for {path!r}")
+
+
+def _walk_size(path: str) -> int:
+    """Recursively sum the allocated size of all files below a directory."""
+    total = 0
+    # fwalk stats entries relative to an open directory fd, so the kernel
+    # doesn't re-resolve the full path of every file
+    for root, dirs, files, root_fd in os.fwalk(path):
+        for name in [d for d in dirs if d.endswith(NOINDEX_SUFFIX)]:
+            try:
+                total += _du_size(os.path.join(root, name))
+                dirs.remove(name)
+            except OSError:
+                pass  # keep walking it here instead
+        for name in files:
+            try:
+                total += _allocated_size(os.stat(name, dir_fd=root_fd, follow_symlinks=False))
+            except OSError:
+                pass
+    return total
+
+
+def _bulk_size_at(fd: int, path: bytes, buf) -> int:
+    """Sum allocated file sizes below an open directory via getattrlistbulk."""
+    attrs = _AttrList(
+        bitmapcount=ATTR_BIT_MAP_COUNT,
+        commonattr=(ATTR_CMN_RETURNED_ATTRS | ATTR_CMN_NAME |
+                    ATTR_CMN_ERROR | ATTR_CMN_OBJTYPE),
+        fileattr=ATTR_FILE_ALLOCSIZE
+    )
+    total = 0
+    subdirs = []
     
+    while True:
+        count = _getattrlistbulk(fd, ctypes.byref(attrs), buf, len(buf), 0)
+        if count < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        if count == 0:
+            break
+        
+        # Each entry: length, returned attribute_set_t, then the returned
+        # attributes in bitmap order (see getattrlistbulk(2))
+        offset = 0
+        for _ in range(count):
+            length, common, _, _, file_attrs, _ = struct.unpack_from('<6I', buf, offset)
+            field = offset + 24
+            error = 0
+            name = None
+            obj_type = 0
+            if common & ATTR_CMN_ERROR:
+                error, = struct.unpack_from('<I', buf, field)
+                field += 4
+            if common & ATTR_CMN_NAME:
+                name_offset, name_length = struct.unpack_from('<iI', buf, field)
+                name, = struct.unpack_from(f'{name_length - 1}s', buf, field + name_offset)
+                field += 8
+            if common & ATTR_CMN_OBJTYPE:
+                obj_type, = struct.unpack_from('<I', buf, field)
+                field += 4
+            if not error:
+                if obj_type == VDIR:
+                    subdirs.append(name)
+                elif file_attrs & ATTR_FILE_ALLOCSIZE:
+                    total += struct.unpack_from('<q', buf, field)[0]
+            offset += length
+    
+    # Recurse only after enumeration finished so the buffer can be reused
+    for name in subdirs:
+        child_path = os.path.join(path, name)
+        if name.endswith(NOINDEX_SUFFIX.encode()):
+            try:
+                total += _du_size(child_path)
+                continue
+            except OSError:
+                pass  # walk it here instead
+        try:
+            child_fd = os.open(name, os.O_RDONLY | os.O_DIRECTORY, dir_fd=fd)
+        except OSError:
+            continue
+        try:
+            total += _bulk_size_at(child_fd, child_path, buf)
+        finally:
+            os.close(child_fd)
+    return total
+
+
+def _bulk_size(path: str) -> int:
+    """Sum allocated file sizes below a directory with getattrlistbulk(2)."""
+    if _getattrlistbulk is None:
+        raise OSError("getattrlistbulk is not available")
+    buf = ctypes.create_string_buffer(BULK_BUFFER_SIZE)
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        return _bulk_size_at(fd, os.fsencode(path), buf)
+    finally:
+        os.close(fd)
+
+
+def _load_size_cache():
+    """Load sizes from previous runs and save them again on exit."""
+    try:
+        with open(SIZE_CACHE_FILE) as f:
+            entries = json.load(f)
+        cutoff = time.time() - SIZE_CACHE_MAX_AGE
+        _disk_cache.update(
+            (path, entry) for path, entry in entries.items() if entry[2] >= cutoff
+        )
+    except (OSError, ValueError, TypeError, IndexError, AttributeError):
+        pass
+    atexit.register(_save_size_cache)
+
+
+def _save_size_cache():
+    """Write the size cache back to disk."""
+    try:
+        os.makedirs(os.path.dirname(SIZE_CACHE_FILE), exist_ok=True)
+        with open(SIZE_CACHE_FILE, 'w') as f:
+            json.dump(_disk_cache, f)
+    except OSError:
+        pass
+
+
+def _forget_size(expanded_path: str):
+    """Drop cached sizes for a directory whose contents changed."""
+    cache_key = os.path.realpath(expanded_path)
+    _size_cache.pop(cache_key, None)
+    _disk_cache.pop(cache_key, None)
+
+
+def _dir_size(path: str) -> int:
+    """Sum the size of a directory tree, preferring the bulk syscall on macOS."""
+    if path.endswith(NOINDEX_SUFFIX):
+        try:
+            return _du_size(path)
+        except OSError:
+            pass
+    if _getattrlistbulk is not None:
+        try:
+            return _bulk_size(path)
+        except OSError:
+            pass
+    return _walk_size(path)
+
+
+def get_directory_size(expanded_path: str) -> Tuple[str, int]:
+    """Get the size of a directory (path must already be expanded)."""
     if not os.path.exists(expanded_path):
         return "Not found", 0
     
     try:
-        result = subprocess.run(
-            ['du', '-sh', expanded_path],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        if result.returncode == 0:
-            size = result.stdout.split('\t')[0].strip()
-            return size, 1  # Return 1 to indicate it exists
-        return "Error", 0
+        dir_stat = os.stat(expanded_path)
+        # Fast path for the common "nothing to clean" case. A link count of 2
+        # only rules out subdirectories (files don't add links on APFS/HFS+),
+        # so confirm with a single directory read.
+        if stat.S_ISDIR(dir_stat.st_mode) and dir_stat.st_nlink <= 2:
+            with os.scandir(expanded_path) as it:
+                if next(it, None) is None:
+                    return "0B", 1
+        
+        cache_key = os.path.realpath(expanded_path)
+        if cache_key in _size_cache:
+            return _size_cache[cache_key]
+        
+        total = 0
+        subdirs = []
+        # A directory's mtime only changes with its direct entries, so fold in
+        # the top-level subdirectories (e.g. each DerivedData project) too.
+        # Deeper writes (a rebuild inside a project) go unnoticed.
+        fingerprint = dir_stat.st_mtime_ns
+        with os.scandir(expanded_path) as it:
+            for entry in it:
+                try:
+                    st = entry.stat(follow_symlinks=False)
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                        fingerprint = max(fingerprint, st.st_mtime_ns)
+                    else:
+                        total += _allocated_size(st)
+                except OSError:
+                    pass
+        
+        cached = _disk_cache.get(cache_key)
+        if cached is not None and cached[0] == fingerprint:
+            return f"~{_format_size(cached[1])}", 1
+        
+        # Walk each top-level subtree in its own worker
+        if len(subdirs) < PARALLEL_MIN_SUBDIRS:
+            total += sum(map(_dir_size, subdirs))
+        else:
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                total += sum(executor.map(_dir_size, subdirs))
+        
+        result = _format_size(total), 1  # Return 1 to indicate it exists
+        _size_cache[cache_key] = result
+        _disk_cache[cache_key] = [fingerprint, total, time.time()]
+        return result
     except Exception:
         return "Error", 0
 
 
+async def _run_command(args: List[str], timeout: float = None) -> int:
+    """Run a command without blocking the event loop and return its exit code."""
+    # Output is never used, so don't capture or decode it
+    process = await asyncio.create_subprocess_exec(
+        *args,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.DEVNULL
+    )
+    try:
+        await asyncio.wait_for(process.wait(), timeout)
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        raise
+    return process.returncode
+
+
 def get_available_space() -> str:
     """Get available disk space."""
     try:
-        result = subprocess.run(
-            ['df', '-h', '/'],
-            capture_output=True,
-            text=True
-        )
-        if result.returncode == 0:
-            lines = result.stdout.strip().split('\n')
-            if len(lines) >= 2:
-                parts = lines[1].split()
-                if len(parts) >= 4:
-                    return parts[3]  # Available space
-        return "Unknown"
-    except Exception:
+        st = os.statvfs('/')
+        return _format_size(st.f_bavail * st.f_frsize)
+    except OSError:
         return "Unknown"
 
 
@@ -213,8 +519,34 @@ def format_category_choice(category: Dict) -> str:
     return f"{icon} {name} (typically {typical})"
 
 
-def show_category_details():
+async def show_category_details():
     """Show detailed information about all categories."""
+    safety_display = {
+        'safe': '✓ Safe',
+        'caution': '⚠️  Caution',
+        'advanced': '⚡ Advanced'
+    }
+    
+    # Size all directories concurrently; the paths are independent
+    loop = asyncio.get_running_loop()
+    directories = [cat for cat in CATEGORIES if cat['type'] == 'directory']
+    results = await asyncio.gather(*(
+        loop.run_in_executor(None, get_directory_size, cat['expanded_path'])
+        for cat in directories
+    ))
+    sizes = {cat['name']: size for cat, (size, _) in zip(directories, results)}
+    
+    # Build every row before touching the table so no I/O runs while it's built
+    rows = [
+        (
+            category['name'],
+            category['description'],
+            sizes.get(category['name'], 'N/A'),
+            safety_display.get(category['safety'], 'Unknown')
+        )
+        for category in CATEGORIES
+    ]
+    
     table = Table(title="Cleanup Categories", box=box.ROUNDED)
     
     table.add_column("Category", no_wrap=True)
@@ -222,30 +554,14 @@ def show_category_details():
     table.add_column("Size")
     table.add_column("Safety")
     
-    for category in CATEGORIES:
-        safety_display = {
-            'safe': '✓ Safe',
-            'caution': '⚠️  Caution',
-            'advanced': '⚡ Advanced'
-        }
-        
-        if category['type'] == 'directory':
-            size, _ = get_directory_size(category['path'])
-        else:
-            size = 'N/A'
-        
-        table.add_row(
-            category['name'],
-            category['description'],
-            size,
-            safety_display.get(category['safety'], 'Unknown')
-        )
+    for row in rows:
+        table.add_row(*row)
     
     console.print(table)
     console.print()
 
 
-def select_categories() -> List[Dict]:
+async def select_categories() -> List[Dict]:
     """Interactive category selection."""
     choices = [
         {
@@ -260,61 +576,200 @@ def select_categories() -> List[Dict]:
     console.print("Use ↑↓ to navigate, Space to toggle, 'a' to select all, Enter to confirm")
     console.print()
     
-    selected = questionary.checkbox(
+    selected = await questionary.checkbox(
         '',
         choices=choices,
         style=custom_style
-    ).ask()
+    ).ask_async()
     
     return selected if selected else []
 
 
-def clean_directory(path: str) -> Tuple[bool, str, str]:
-    """Clean a directory by removing all its contents."""
-    expanded_path = os.path.expanduser(path)
+def _spawn_rm(rm_path: str, args: List[str]) -> str:
+    """Run rm via posix_spawn and wait for it; return its error output if it failed."""
+    read_fd, write_fd = os.pipe()
+    try:
+        pid = os.posix_spawn(
+            rm_path, args, os.environ,
+            file_actions=[(os.POSIX_SPAWN_DUP2, write_fd, 2)]
+        )
+    except OSError:
+        os.close(read_fd)
+        raise
+    finally:
+        os.close(write_fd)
+    with os.fdopen(read_fd, 'rb') as stderr:
+        stderr_bytes = stderr.read()
+    _, status = os.waitpid(pid, 0)
+    return stderr_bytes.decode(errors='replace').strip() if status != 0 else ''
+
+
+async def _rm_batch(rm_path: str, batch: List[str]) -> str:
+    """Run one `rm -rf` over a batch of paths; return its error output if it failed."""
+    args = ['rm', '-rf', '--', *batch]
+    try:
+        if hasattr(os, 'posix_spawn'):
+            # posix_spawn starts rm without fork() duplicating this process first
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, _spawn_rm, rm_path, args)
+        
+        process = await asyncio.create_subprocess_exec(
+            rm_path, *args[1:],
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE
+        )
+    except OSError as e:
+        return str(e)
+    _, stderr = await process.communicate()
+    return stderr.decode(errors='replace').strip() if process.returncode != 0 else ''
+
+
+async def _rm_paths(rm_path: str, paths: List[str],
+                    on_batch_done: Callable[[List[str], str], None]):
+    """Remove files and directory trees with parallel `rm -rf` processes.
     
-    if not os.path.exists(expanded_path):
-        return True, "Directory not found", "0B"
+    on_batch_done is called with each batch and its error output ('' on
+    success) as soon as that batch finishes.
+    """
+    workers = os.cpu_count() or 1
+    # Spread the paths over all cores, but keep each command line short
+    batch_size = max(1, min(RM_BATCH_SIZE, -(-len(paths) // workers)))
+    batches = [paths[i:i + batch_size] for i in range(0, len(paths), batch_size)]
     
-    # Get size before deletion
-    size_before, _ = get_directory_size(path)
+    # At most `workers` rm processes at a time; a new batch starts as soon as
+    # any running one finishes instead of waiting for the slowest of a wave
+    slots = asyncio.Semaphore(workers)
     
-    try:
-        # Remove all contents
-        for item in os.listdir(expanded_path):
-            item_path = os.path.join(expanded_path, item)
-            if os.path.isdir(item_path):
-                shutil.rmtree(item_path)
-            else:
-                os.remove(item_path)
-        
-        return True, "Cleaned successfully", size_before
-    except Exception as e:
-        return False, f"Error: {str(e)}", "0B"
+    async def run(batch: List[str]):
+        async with slots:
+            error = await _rm_batch(rm_path, batch)
+        on_batch_done(batch, error)
+    
+    await asyncio.gather(*map(run, batches))
+
+
+async def clean_directories(
+    expanded_paths: List[str],
+    on_done: Optional[Callable[[str, Tuple[bool, str, str]], None]] = None
+) -> List[Tuple[bool, str, str]]:
+    """Clean several directories by removing all their contents in one go.
+    
+    Paths must already be expanded. Returns (success, message, size freed)
+    for each path, in order. on_done, if given, is called with each path and its result as soon as
+    that directory is finished.
+    """
+    outcomes = {}
+    items = {}
+    failed = set()
+    errors = {}
+    
+    def settle(path: str, outcome: Tuple[bool, str, str]):
+        outcomes[path] = outcome
+        if on_done is not None:
+            on_done(path, outcome)
+    
+    def finish(path: str):
+        _forget_size(path)
+        # A failure belongs to the directory only if it still has leftovers
+        if path in failed and any(os.path.lexists(item) for item in items[path]):
+            error = errors.get(path, "could not remove all entries")
+            settle(path, (False, f"Error: {error}", "0B"))
+        else:
+            settle(path, (True, "Cleaned successfully", sizes[path]))
+    
+    for path in expanded_paths:
+        if not os.path.exists(path):
+            settle(path, (True, "Directory not found", "0B"))
+            continue
+        try:
+            items[path] = [os.path.join(path, item) for item in os.listdir(path)]
+        except OSError as e:
+            settle(path, (False, f"Error: {str(e)}", "0B"))
+            continue
+    
+    # rm can't report what it freed, so size every directory up front. Sizes
+    # this run already measured (details view) are reused; the rest are
+    # taken with du, all directories at once.
+    loop = asyncio.get_running_loop()
+    
+    async def measure(path: str) -> str:
+        cached = _size_cache.get(os.path.realpath(path))
+        if cached:
+            return cached[0]
+        if not items[path]:
+            return "0B"
+        try:
+            return _format_size(await loop.run_in_executor(None, _du_size, path))
+        except OSError:
+            return "Unknown"
+    
+    sizes = dict(zip(items, await asyncio.gather(*map(measure, items))))
+    
+    owners = {item: path for path, paths in items.items() for item in paths}
+    remaining = {path: len(paths) for path, paths in items.items()}
+    for path, count in remaining.items():
+        if count == 0:
+            finish(path)
+    
+    def batch_done(batch: List[str], error: str):
+        if error:
+            failed.update(owners[item] for item in batch)
+            # Charge each line to the directory whose entry it names (longest
+            # match, so '.../ab' isn't taken for '.../a'); a line naming none
+            # of them, such as a spawn failure, applies to the whole batch
+            for line in error.splitlines():
+                named = [item for item in batch if item in line]
+                targets = [max(named, key=len)] if named else batch
+                for item in targets:
+                    errors.setdefault(owners[item], line)
+        for item in batch:
+            path = owners[item]
+            remaining[path] -= 1
+            if remaining[path] == 0:
+                finish(path)
+    
+    # One shared set of rm processes for every directory, so small
+    # categories don't each start their own
+    rm_path = shutil.which('rm') or '/bin/rm'
+    await _rm_paths(rm_path, list(owners), batch_done)
+    
+    return [outcomes[path] for path in expanded_paths]
 
 
-def execute_command(command: str) -> Tuple[bool, str]:
-    """Execute a shell command."""
+async def execute_command(argv: List[str]) -> Tuple[bool, str]:
+    """Execute a command given as an argument list."""
+    timeout = 30
     try:
-        result = subprocess.run(
-            command.split(),
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
+        returncode = await _run_command(argv, timeout=timeout)
         
-        if result.returncode == 0:
+        if returncode == 0:
             return True, "Executed successfully"
         else:
             return True, "No unavailable simulators found"
+    except asyncio.TimeoutError:
+        return False, f"Error: timed out after {timeout}s"
     except Exception as e:
         return False, f"Error: {str(e)}"
 
 
-def perform_cleanup(categories: List[Dict]) -> List[Dict]:
+def _category_result(category: Dict, success: bool, message: str, size: str) -> Dict:
+    """Build the result entry shown for a category."""
+    return {
+        'name': category['name'],
+        'success': success,
+        'message': message,
+        'size': size
+    }
+
+
+async def _clean_command_category(category: Dict, finish: Callable[[Dict, Dict], None]):
+    """Run the command of a single command category."""
+    success, message = await execute_command(category['argv'])
+    finish(category, _category_result(category, success, message, 'N/A'))
+
+
+async def perform_cleanup(categories: List[Dict]) -> List[Dict]:
     """Perform the cleanup operation."""
-    results = []
-    
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -324,30 +779,42 @@ def perform_cleanup(categories: List[Dict]) -> List[Dict]:
     ) as progress:
         
         task = progress.add_task("Cleaning...", total=len(categories))
+        running = [cat['name'] for cat in categories
+                   if cat['type'] in ('directory', 'command')]
+        results = {}
+        
+        def describe() -> str:
+            if not running:
+                return "Cleaning finished"
+            more = f" (+{len(running) - 1} more)" if len(running) > 1 else ""
+            return f"Cleaning: {running[0]}{more}"
+        
+        def finish(category: Dict, result: Dict):
+            results[category['name']] = result
+            running.remove(category['name'])
+            progress.update(task, advance=1, description=describe())
         
-        for category in categories:
-            progress.update(task, description=f"Cleaning: {category['name']}")
-            
-            if category['type'] == 'directory':
-                success, message, size = clean_directory(category['path'])
-                results.append({
-                    'name': category['name'],
-                    'success': success,
-                    'message': message,
-                    'size': size
-                })
-            elif category['type'] == 'command':
-                success, message = execute_command(category['path'])
-                results.append({
-                    'name': category['name'],
-                    'success': success,
-                    'message': message,
-                    'size': 'N/A'
-                })
-            
-            progress.advance(task)
-    
-    return results
+        # All directories are deleted by one shared set of rm processes and
+        # each one is reported as soon as its own entries are gone; commands
+        # run alongside, so total time is that of the slowest job
+        directories = {
+            cat['expanded_path']: cat for cat in categories if cat['type'] == 'directory'
+        }
+        
+        def directory_done(path: str, outcome: Tuple[bool, str, str]):
+            finish(directories[path], _category_result(directories[path], *outcome))
+        
+        progress.update(task, description=describe())
+        jobs = [
+            _clean_command_category(cat, finish)
+            for cat in categories if cat['type'] == 'command'
+        ]
+        if directories:
+            jobs.append(clean_directories(list(directories), directory_done))
+        await asyncio.gather(*jobs)
+    
+    # Report in the order the categories were selected
+    return [results[cat['name']] for cat in categories if cat['name'] in results]
 
 
 def show_results(results: List[Dict]):
@@ -361,14 +828,16 @@ def show_results(results: List[Dict]):
     table.add_column("Status")
     table.add_column("Size Freed")
     
-    for result in results:
-        status_icon = "✓" if result['success'] else "✗"
-        
-        table.add_row(
+    rows = [
+        (
             result['name'],
-            f"{status_icon} {result['message']}",
+            f"{'✓' if result['success'] else '✗'} {result['message']}",
             result['size']
         )
+        for result in results
+    ]
+    for row in rows:
+        table.add_row(*row)
     
     console.print(table)
     console.print()
@@ -378,25 +847,27 @@ def show_results(results: List[Dict]):
     console.print()
 
 
-def main():
+async def main():
     """Main application flow."""
     try:
+        _load_size_cache()
+        
         # Show header
         show_header()
         
         # Show category details
-        show_details = questionary.confirm(
+        show_details = await questionary.confirm(
             "Would you like to see detailed information about all categories?",
             default=False,
             style=custom_style
-        ).ask()
+        ).ask_async()
         
         if show_details:
             console.print()
-            show_category_details()
+            await show_category_details()
         
         # Select categories
-        selected_categories = select_categories()
+        selected_categories = await select_categories()
         
         if not selected_categories:
             console.print("[yellow]No categories selected. Exiting.[/yellow]")
@@ -407,12 +878,12 @@ def main():
         console.print()
         
         # Confirmation
-        confirm = questionary.confirm(
+        confirm = await questionary.confirm(
             f"⚠️  Delete cache files from {len(selected_categories)} categories? "
             "(Your projects and source code will NOT be affected)",
             default=False,
             style=custom_style
-        ).ask()
+        ).ask_async()
         
         if not confirm:
             console.print("[yellow]Cleanup cancelled.[/yellow]")
@@ -421,24 +892,23 @@ def main():
         console.print()
         
         # Perform cleanup
-        results = perform_cleanup(selected_categories)
+        results = await perform_cleanup(selected_categories)
         
         # Show results
         show_results(results)
         
         # Optional: Empty trash
-        empty_trash = questionary.confirm(
+        empty_trash = await questionary.confirm(
             "Would you like to empty the Trash?",
             default=False,
             style=custom_style
-        ).ask()
+        ).ask_async()
         
         if empty_trash:
             console.print("Emptying trash...")
             try:
-                subprocess.run(
+                await _run_command(
                     ['osascript', '-e', 'tell application "Finder" to empty trash'],
-                    capture_output=True,
                     timeout=30
                 )
                 console.print("✓ Trash emptied")
@@ -448,7 +918,7 @@ def main():
         console.print()
         console.print("[bold]🎉 All done![/bold]")
         
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, asyncio.CancelledError):
         console.print()
         console.print("Cleanup cancelled by user.")
         sys.exit(0)
@@ -459,4 +929,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    asyncio.run(main())